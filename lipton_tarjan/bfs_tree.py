@@ -169,21 +169,19 @@ def collapse_bfs_subtree(graph, bfs_levels, subtree_max_level, bfs_tree_edges_ma
             PlanarGraph(new_new_graph_vertex_costs, new_new_graph_incident_edge_example_indices,
             new_graph.edges)
 
-def _update_parent_total_descendants_costs(vertex, edges, parent_edge_index,
-        total_descendants_costs):
-
-    parent_vertex = edges.get_opposite_vertex(parent_edge_index, vertex)
-    total_descendants_costs[parent_vertex] += total_descendants_costs[vertex]
-
-_set_total_descendants_costs = \
-        utils.make_traverse_graph_via_post_order_dfs(_update_parent_total_descendants_costs)
-
 def record_bfs_tree_parent_edge_indices_and_total_descendants_costs(graph, bfs_tree_root,
         bfs_tree_edges_mask):
 
     total_descendants_costs = graph.vertex_costs.copy()
 
-    parent_edge_indices = _set_total_descendants_costs(bfs_tree_root, graph,
-            bfs_tree_edges_mask, total_descendants_costs)
+    post_order_vertices, parent_edge_indices = utils.traverse_graph_via_post_order_dfs(
+            bfs_tree_root, graph, bfs_tree_edges_mask)
+
+    # the root is the last vertex in post-order and has no parent
+
+    for vertex in post_order_vertices[:-1]:
+
+        parent_vertex = graph.edges.get_opposite_vertex(parent_edge_indices[vertex], vertex)
+        total_descendants_costs[parent_vertex] += total_descendants_costs[vertex]
 
     return parent_edge_indices, total_descendants_costs
@@ -13,7 +13,8 @@ class PlanarGraph:
     "A separator theorem for planar graphs", tech. rep., Stanford, CA, USA, 1977.
     """
 
-    def __init__(self, vertex_costs, incident_edge_example_indices, edges):
+    def __init__(self, vertex_costs, incident_edge_example_indices, edges,
+            incidence_offsets=None, incidence_edge_indices=None):
         """
         Graph initialization.
 
@@ -26,6 +27,10 @@ class PlanarGraph:
             An array where for each vertex an index of one edge incident to this vertex is stored.
         edges : PlanarGraphEdges
             Edges list.
+        incidence_offsets : array_like, int32, optional
+            Precomputed `incidence_offsets`, consistent with current `edges` state.
+        incidence_edge_indices : array_like, int32, optional
+            Precomputed `incidence_edge_indices`, consistent with current `edges` state.
         """
 
         self._vertex_costs = vertex_costs
@@ -33,6 +38,10 @@ class PlanarGraph:
         self._edges = edges
         self._size = len(self._vertex_costs)
 
+        self._incidence_offsets = incidence_offsets
+        self._incidence_edge_indices = incidence_edge_indices
+        self._incidence_modifications_count = edges.modifications_count
+
     @property
     def vertex_costs(self):
 
@@ -58,6 +67,52 @@ class PlanarGraph:
 
         return self._edges.size
 
+    @property
+    def incidence_offsets(self):
+        """
+        An array of size `size + 1`, where incident edge indices of `vertex` are stored in
+        `incidence_edge_indices[incidence_offsets[vertex]:incidence_offsets[vertex + 1]]`.
+        """
+
+        self._update_incidence()
+
+        return self._incidence_offsets
+
+    @property
+    def incidence_edge_indices(self):
+        """
+        Incident edge indices of all vertices laid out contiguously, for each vertex in the order
+        of `get_incident_edge_indices`. The array is computed lazily and recomputed when `edges`
+        are modified.
+        """
+
+        self._update_incidence()
+
+        return self._incidence_edge_indices
+
+    def _update_incidence(self):
+
+        if self._incidence_offsets is not None and \
+                self._incidence_modifications_count == self._edges.modifications_count:
+            return
+
+        incidence_offsets = np.zeros(self._size + 1, dtype=np.int32)
+        incidence_edge_indices = np.zeros(2*self._edges.size, dtype=np.int32)
+
+        incidence_index = 0
+
+        for vertex in range(self._size):
+            for edge_index in self.get_incident_edge_indices(vertex):
+
+                incidence_edge_indices[incidence_index] = edge_index
+                incidence_index += 1
+
+            incidence_offsets[vertex + 1] = incidence_index
+
+        self._incidence_offsets = incidence_offsets
+        self._incidence_edge_indices = incidence_edge_indices
+        self._incidence_modifications_count = self._edges.modifications_count
+
     def get_incident_edge_indices(self, vertex):
 
         if self._incident_edge_example_indices[vertex] == -1:
@@ -1,4 +1,5 @@
 import numpy as np
+import itertools
 from . import utils
 from .planar_graph import PlanarGraph
 from .planar_graph_edges import PlanarGraphEdges
@@ -48,7 +49,7 @@ class PlanarGraphConstructor:
         Returns
         -------
         PlanarGraph
-            The same graph up to different incident edge examples.
+            A copy of the graph.
         """
 
         return clone_graph(graph)
@@ -74,9 +75,36 @@ class PlanarGraphConstructor:
         Only normal graphs are supported, i.e. no multiple edges or loops.
         """
 
-        return _construct_from_ordered_adjacencies(ordered_adjacencies)
+        return construct_from_ordered_adjacencies(ordered_adjacencies)
 
 
+def _get_new_indices_mapping(mask):
+
+    new_indices = np.cumsum(mask, dtype=np.int32) - 1
+
+    return np.where(mask, new_indices, np.int32(-1))
+
+def _link_incident_edges(edges, incidence_offsets, incidence_vertices, incidence_edge_indices):
+
+    first_incidence_indices = incidence_offsets[:-1]
+    last_incidence_indices = incidence_offsets[1:] - 1
+    has_incidences_mask = (first_incidence_indices <= last_incidence_indices)
+
+    incident_edge_example_indices = utils.repeat_int(-1, len(incidence_offsets) - 1)
+    incident_edge_example_indices[has_incidences_mask] = \
+            incidence_edge_indices[first_incidence_indices[has_incidences_mask]]
+
+    # incident edges of each vertex are traversed cyclically
+
+    next_incidence_indices = np.arange(1, len(incidence_edge_indices) + 1, dtype=np.int32)
+    next_incidence_indices[last_incidence_indices[has_incidences_mask]] = \
+            first_incidence_indices[has_incidences_mask]
+
+    edges.set_next_edges(incidence_edge_indices, incidence_vertices,
+            incidence_edge_indices[next_incidence_indices])
+
+    return incident_edge_example_indices
+
 def construct_subgraph(graph, subgraph_vertices_mask, subgraph_edges_mask):
     """
     Linear algorithm for subgraph construction.
@@ -101,69 +129,46 @@ def construct_subgraph(graph, subgraph_vertices_mask, subgraph_edges_mask):
         Result subgraph
     """
 
-    vertex_costs = graph.vertex_costs[subgraph_vertices_mask]
-
-    new_vertices_mapping = utils.repeat_int(-1, graph.size)
-    current_new_vertex = 0
-
-    for vertex, is_in_subgraph in enumerate(subgraph_vertices_mask):
-        if is_in_subgraph:
-            new_vertices_mapping[vertex] = current_new_vertex
-            current_new_vertex += 1
-
-    edges_count = 0
-    new_edge_indices_mapping = utils.repeat_int(-1, graph.edges_count)
-
-    for edge_index in range(graph.edges_count):
-
-        edge_vertex1 = graph.edges.vertex1[edge_index]
-        edge_vertex2 = graph.edges.vertex2[edge_index]
-
-        if subgraph_vertices_mask[edge_vertex1] and subgraph_vertices_mask[edge_vertex2] and \
-                subgraph_edges_mask[edge_index]:
-            new_edge_indices_mapping[edge_index] = edges_count
-            edges_count += 1
-
-    edges = PlanarGraphEdges(edges_count)
-
-    for edge_index in range(graph.edges_count):
+    subgraph_vertices_mask = np.asarray(subgraph_vertices_mask, dtype=np.bool_)
+    subgraph_edges_mask = np.asarray(subgraph_edges_mask, dtype=np.bool_)
 
-        edge_vertex1 = graph.edges.vertex1[edge_index]
-        edge_vertex2 = graph.edges.vertex2[edge_index]
+    vertex_costs = graph.vertex_costs[subgraph_vertices_mask]
 
-        if subgraph_vertices_mask[edge_vertex1] and subgraph_vertices_mask[edge_vertex2] and \
-                subgraph_edges_mask[edge_index]:
-            edges.append(new_vertices_mapping[edge_vertex1], new_vertices_mapping[edge_vertex2])
+    new_vertices_mapping = _get_new_indices_mapping(subgraph_vertices_mask)
 
-    incident_edge_example_indices = utils.repeat_int(-1, len(vertex_costs))
+    new_edges_mask = np.logical_and(subgraph_edges_mask,
+            np.logical_and(subgraph_vertices_mask[graph.edges.vertex1],
+            subgraph_vertices_mask[graph.edges.vertex2]))
 
-    for vertex, is_in_subgraph in enumerate(subgraph_vertices_mask):
-        if is_in_subgraph:
+    new_edge_indices_mapping = _get_new_indices_mapping(new_edges_mask)
 
-            new_vertex = new_vertices_mapping[vertex]
+    edges = PlanarGraphEdges.from_arrays(
+            new_vertices_mapping[graph.edges.vertex1[new_edges_mask]],
+            new_vertices_mapping[graph.edges.vertex2[new_edges_mask]])
 
-            first_new_edge_index = -1
-            previous_new_edge_index = -1
+    # incidences of the subgraph are incidences of the graph restricted to the subgraph, in the
+    # same order
 
-            for edge_index in graph.get_incident_edge_indices(vertex):
+    incidence_vertices = np.repeat(np.arange(graph.size, dtype=np.int32),
+            np.diff(graph.incidence_offsets))
 
-                new_edge_index = new_edge_indices_mapping[edge_index]
+    new_incidence_edge_indices = new_edge_indices_mapping[graph.incidence_edge_indices]
+    new_incidence_mask = (new_incidence_edge_indices != -1)
 
-                if new_edge_index != -1:
+    new_incidence_edge_indices = new_incidence_edge_indices[new_incidence_mask]
 
-                    if previous_new_edge_index == -1:
-                        incident_edge_example_indices[new_vertex] = new_edge_index
-                        first_new_edge_index = new_edge_index
-                    else:
-                        edges.set_previous_edge(new_edge_index, new_vertex, previous_new_edge_index)
+    new_incidence_vertices = new_vertices_mapping[incidence_vertices[new_incidence_mask]]
 
-                    previous_new_edge_index = new_edge_index
+    new_incidence_offsets = np.zeros(len(vertex_costs) + 1, dtype=np.int32)
+    new_incidence_offsets[1:] = np.cumsum(np.bincount(new_incidence_vertices,
+            minlength=len(vertex_costs)))
 
-            if first_new_edge_index != -1:
-                edges.set_previous_edge(first_new_edge_index, new_vertex, previous_new_edge_index)
+    incident_edge_example_indices = _link_incident_edges(edges, new_incidence_offsets,
+            new_incidence_vertices, new_incidence_edge_indices)
 
     return new_vertices_mapping, new_edge_indices_mapping, PlanarGraph(vertex_costs,
-            incident_edge_example_indices, edges)
+            incident_edge_example_indices, edges, new_incidence_offsets,
+            new_incidence_edge_indices)
 
 def clone_graph(graph):
     """
@@ -176,63 +181,87 @@ def clone_graph(graph):
     Returns
     -------
     PlanarGraph
-        The same graph up to different incident edge examples.
+        A copy of the graph.
     """
 
-    _, _, graph = construct_subgraph(graph, utils.repeat_bool(True, graph.size),
-            utils.repeat_bool(True, graph.edges_count))
+    return PlanarGraph(graph.vertex_costs.copy(), graph.incident_edge_example_indices.copy(),
+            graph.edges.clone())
 
-    return graph
+def _to_csr(ordered_adjacencies):
 
-def _create_edges_and_map_adjacencies(adjacent_vertices):
+    degrees = np.fromiter(map(len, ordered_adjacencies), dtype=np.int32,
+            count=len(ordered_adjacencies))
 
-    edges = PlanarGraphEdges(sum(len(vertices) for vertices in adjacent_vertices)//2)
-    edge_indices_by_adjacencies = {}
+    adjacencies_offsets = np.zeros(len(ordered_adjacencies) + 1, dtype=np.int32)
+    adjacencies_offsets[1:] = np.cumsum(degrees)
 
-    for vertex, vertex_adjacent_vertices in enumerate(adjacent_vertices):
-        for adjacent_vertex in vertex_adjacent_vertices:
+    adjacent_vertices = np.fromiter(itertools.chain.from_iterable(ordered_adjacencies),
+            dtype=np.int32, count=adjacencies_offsets[-1])
 
-            if (vertex, adjacent_vertex) not in edge_indices_by_adjacencies:
+    return degrees, adjacencies_offsets, adjacent_vertices
 
-                edge_indices_by_adjacencies[(vertex, adjacent_vertex)] = edges.size
-                edge_indices_by_adjacencies[(adjacent_vertex, vertex)] = edges.size
-                edges.append(vertex, adjacent_vertex)
+def _get_adjacency_keys(vertices, adjacent_vertices, vertices_count):
 
-    return edges, edge_indices_by_adjacencies
+    lower_vertices = np.minimum(vertices, adjacent_vertices).astype(np.int64)
+    upper_vertices = np.maximum(vertices, adjacent_vertices).astype(np.int64)
 
-def _construct_from_ordered_adjacencies(ordered_adjacencies):
+    return lower_vertices*vertices_count + upper_vertices
 
-    vertices_count = len(ordered_adjacencies)
+def _create_edges_and_map_adjacencies(degrees, adjacent_vertices):
 
-    vertex_costs = utils.repeat_float(1/vertices_count, vertices_count)
+    vertices_count = len(degrees)
+
+    vertices = np.repeat(np.arange(vertices_count, dtype=np.int32), degrees)
+
+    # each edge is listed in adjacencies of both of its vertices, so it is added once when
+    # encountered from the lower one
 
-    edges, edge_indices_by_adjacencies = \
-            _create_edges_and_map_adjacencies(ordered_adjacencies)
+    edge_starts_mask = (vertices < adjacent_vertices)
 
-    incident_edge_example_indices = utils.repeat_int(-1, vertices_count)
+    edges = PlanarGraphEdges.from_arrays(vertices[edge_starts_mask],
+            adjacent_vertices[edge_starts_mask])
 
-    for vertex, vertex_ordered_adjacencies in enumerate(ordered_adjacencies):
+    edge_keys = _get_adjacency_keys(edges.vertex1, edges.vertex2, vertices_count)
+    sorted_edge_indices = np.argsort(edge_keys).astype(np.int32)
 
-        adjacent_vertices_count = len(vertex_ordered_adjacencies)
+    adjacency_keys = _get_adjacency_keys(vertices, adjacent_vertices, vertices_count)
 
-        if adjacent_vertices_count != 0:
+    incident_edge_indices = sorted_edge_indices[np.searchsorted(edge_keys[sorted_edge_indices],
+            adjacency_keys)]
 
-            first_adjacent_vertex = vertex_ordered_adjacencies[0]
-            first_incident_edge_index = edge_indices_by_adjacencies[(vertex,
-                    first_adjacent_vertex)]
-            incident_edge_example_indices[vertex] = first_incident_edge_index
+    return edges, vertices, incident_edge_indices
+
+def construct_from_ordered_adjacencies(ordered_adjacencies):
+    """
+    Convenient method for constructing planar graph.
+
+    Parameters
+    ----------
+    ordered_adjacencies : list of list of int
+        The list, where for each vertex the list of its adjacent vertices is provided in the
+        order of ccw traversal (or cw traversal, it's just a convention). For instance,
+        `[[1, 2, 3, 4], [0], [0], [0], [0]]` would encode a "star" graph with 4 edges.
 
-            for adjacent_vertex_index, adjacent_vertex in \
-                    enumerate(vertex_ordered_adjacencies):
+    Returns
+    -------
+    PlanarGraph
+
+    Notes
+    -----
+    Only normal graphs are supported, i.e. no multiple edges or loops.
+    """
+
+    vertices_count = len(ordered_adjacencies)
+
+    vertex_costs = utils.repeat_float(1/vertices_count, vertices_count)
 
-                incident_edge_index = edge_indices_by_adjacencies[(vertex, adjacent_vertex)]
+    degrees, adjacencies_offsets, adjacent_vertices = _to_csr(ordered_adjacencies)
 
-                next_adjacent_vertex_index = (adjacent_vertex_index + 1)%adjacent_vertices_count
-                next_adjacent_vertex = \
-                        vertex_ordered_adjacencies[next_adjacent_vertex_index]
-                next_incident_edge_index = \
-                        edge_indices_by_adjacencies[(vertex, next_adjacent_vertex)]
+    edges, vertices, incident_edge_indices = _create_edges_and_map_adjacencies(degrees,
+            adjacent_vertices)
 
-                edges.set_next_edge(incident_edge_index, vertex, next_incident_edge_index)
+    incident_edge_example_indices = _link_incident_edges(edges, adjacencies_offsets, vertices,
+            incident_edge_indices)
 
-    return PlanarGraph(vertex_costs, incident_edge_example_indices, edges)
+    return PlanarGraph(vertex_costs, incident_edge_example_indices, edges, adjacencies_offsets,
+            incident_edge_indices)
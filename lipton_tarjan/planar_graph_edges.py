@@ -19,12 +19,51 @@ class PlanarGraphEdges:
                 self._vertex1_previous_edge_index, self._vertex2_next_edge_index, \
                 self._vertex2_previous_edge_index = self._allocate_data(capacity)
         self._size = 0
+        self._modifications_count = 0
+
+    @staticmethod
+    def from_arrays(vertex1, vertex2):
+        """
+        Create edges list from arrays of incident vertices. Next/previous edge indices are left
+        unset.
+        """
+
+        edges = PlanarGraphEdges(len(vertex1))
+
+        edges._vertex1[:] = vertex1
+        edges._vertex2[:] = vertex2
+        edges._size = len(vertex1)
+
+        return edges
+
+    def clone(self):
+
+        edges = PlanarGraphEdges(0)
+
+        edges._vertex1 = self._vertex1[:self._size].copy()
+        edges._vertex2 = self._vertex2[:self._size].copy()
+        edges._vertex1_next_edge_index = self._vertex1_next_edge_index[:self._size].copy()
+        edges._vertex1_previous_edge_index = self._vertex1_previous_edge_index[:self._size].copy()
+        edges._vertex2_next_edge_index = self._vertex2_next_edge_index[:self._size].copy()
+        edges._vertex2_previous_edge_index = self._vertex2_previous_edge_index[:self._size].copy()
+        edges._size = self._size
+
+        return edges
 
     @property
     def size(self):
 
         return self._size
 
+    @property
+    def modifications_count(self):
+        """
+        Number of modifications made to the edges list, can be used to invalidate data derived
+        from it.
+        """
+
+        return self._modifications_count
+
     @property
     def vertex1(self):
 
@@ -41,6 +80,7 @@ class PlanarGraphEdges:
         self._vertex2[self._size] = vertex2
 
         self._size += 1
+        self._modifications_count += 1
 
     def extend(self, edges):
 
@@ -58,6 +98,7 @@ class PlanarGraphEdges:
                 edges._vertex2_previous_edge_index[:edges._size]))
 
         self._size += edges.size
+        self._modifications_count += 1
 
     def increase_capacity(self, capacity):
 
@@ -100,14 +141,29 @@ class PlanarGraphEdges:
 
     def set_next_edge(self, edge_index, vertex, other_edge_index):
 
+        self._modifications_count += 1
+
         self._set_next_edge_only(edge_index, vertex, other_edge_index)
         self._set_previous_edge_only(other_edge_index, vertex, edge_index)
 
     def set_previous_edge(self, edge_index, vertex, other_edge_index):
 
+        self._modifications_count += 1
+
         self._set_previous_edge_only(edge_index, vertex, other_edge_index)
         self._set_next_edge_only(other_edge_index, vertex, edge_index)
 
+    def set_next_edges(self, edge_indices, vertices, other_edge_indices):
+        """
+        Vectorized `set_next_edge` for arrays of edge indices, vertices and other edge indices.
+        Each (edge index, vertex) pair is assumed to occur at most once.
+        """
+
+        self._modifications_count += 1
+
+        self._set_next_edges_only(edge_indices, vertices, other_edge_indices)
+        self._set_previous_edges_only(other_edge_indices, vertices, edge_indices)
+
     def _set_next_edge_only(self, edge_index, vertex, other_edge_index):
 
         if vertex == self._vertex1[edge_index]:
@@ -122,6 +178,24 @@ class PlanarGraphEdges:
         else:
             self._vertex2_previous_edge_index[edge_index] = other_edge_index
 
+    def _set_next_edges_only(self, edge_indices, vertices, other_edge_indices):
+
+        is_vertex1 = (vertices == self._vertex1[edge_indices])
+        is_vertex2 = np.logical_not(is_vertex1)
+
+        self._vertex1_next_edge_index[edge_indices[is_vertex1]] = other_edge_indices[is_vertex1]
+        self._vertex2_next_edge_index[edge_indices[is_vertex2]] = other_edge_indices[is_vertex2]
+
+    def _set_previous_edges_only(self, edge_indices, vertices, other_edge_indices):
+
+        is_vertex1 = (vertices == self._vertex1[edge_indices])
+        is_vertex2 = np.logical_not(is_vertex1)
+
+        self._vertex1_previous_edge_index[edge_indices[is_vertex1]] = \
+                other_edge_indices[is_vertex1]
+        self._vertex2_previous_edge_index[edge_indices[is_vertex2]] = \
+                other_edge_indices[is_vertex2]
+
     def get_next_edge_index(self, edge_index, vertex):
 
         if vertex == self._vertex1[edge_index]:
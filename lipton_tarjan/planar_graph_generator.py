@@ -79,8 +79,7 @@ def _generate_random_tree(size, random_vertex_costs):
         raise RuntimeError('The minimum size of 2 is allowed.')
 
     if random_vertex_costs:
-        # Hacks to make numba work
-        vertex_costs = np.array([np.random.uniform(0, 1) for _ in range(size)], dtype=float32)
+        vertex_costs = np.random.uniform(0, 1, size).astype(np.float32)
     else:
         vertex_costs = np.ones(size, dtype=np.float32)
 
@@ -94,9 +93,12 @@ def _generate_random_tree(size, random_vertex_costs):
 
     incident_edge_example_indices = np.zeros(size, dtype=np.int32)
 
-    for index in range(size - 2):
+    # a vertex to attach each new leaf to is sampled uniformly from already added vertices
+
+    attachment_vertices = (np.random.uniform(0, 1, size - 2)*np.arange(2, size)).astype(np.int32)
+
+    for index, vertex in enumerate(attachment_vertices):
 
-        vertex = np.random.choice(index + 2)
         new_vertex = index + 2
 
         incident_edge_index = incident_edge_example_indices[vertex]
@@ -118,26 +120,17 @@ def _generate_random_tree(size, random_vertex_costs):
 
 def _remove_double_edges(graph):
 
-    is_adjacent_vertex_mask = utils.repeat_bool(False, graph.size)
-
-    edge_indices_mask = utils.repeat_bool(True, graph.edges_count)
-
-    for vertex in range(graph.size):
-
-        for edge_index in graph.get_incident_edge_indices(vertex):
+    lower_vertices = np.minimum(graph.edges.vertex1, graph.edges.vertex2).astype(np.int64)
+    upper_vertices = np.maximum(graph.edges.vertex1, graph.edges.vertex2).astype(np.int64)
 
-            adjacent_vertex = graph.edges.get_opposite_vertex(edge_index, vertex)
+    # only the first edge with the given pair of vertices is left, loops are dropped
 
-            if is_adjacent_vertex_mask[adjacent_vertex]:
-                edge_indices_mask[edge_index] = False
-            else:
-                if edge_indices_mask[edge_index]:
-                    is_adjacent_vertex_mask[adjacent_vertex] = True
+    _, first_edge_indices = np.unique(lower_vertices*graph.size + upper_vertices,
+            return_index=True)
 
-        for edge_index in graph.get_incident_edge_indices(vertex):
-
-            adjacent_vertex = graph.edges.get_opposite_vertex(edge_index, vertex)
-            is_adjacent_vertex_mask[adjacent_vertex] = False
+    edge_indices_mask = utils.repeat_bool(False, graph.edges_count)
+    edge_indices_mask[first_edge_indices] = True
+    edge_indices_mask[lower_vertices == upper_vertices] = False
 
     _, _, graph = planar_graph_constructor.construct_subgraph(graph,
             utils.repeat_bool(True, graph.size), edge_indices_mask)
@@ -146,11 +139,10 @@ def _remove_double_edges(graph):
 
 def _normalize_vertex_costs(graph):
 
-    vertex_costs = graph.vertex_costs.copy()
-
-    vertex_costs /= vertex_costs.sum()
+    vertex_costs = graph.vertex_costs*np.float32(1/graph.vertex_costs.sum(dtype=np.float32))
 
-    return PlanarGraph(vertex_costs, graph.incident_edge_example_indices, graph.edges)
+    return PlanarGraph(vertex_costs, graph.incident_edge_example_indices, graph.edges,
+            graph.incidence_offsets, graph.incidence_edge_indices)
 
 def _generate_random_graph(size, density, random_vertex_costs):
 
@@ -159,12 +151,10 @@ def _generate_random_graph(size, density, random_vertex_costs):
     _, triangulated_tree = triangulator.triangulate(tree)
 
     edges_to_leave_count = int(density*triangulated_tree.edges_count)
-    edges_to_delete_count = triangulated_tree.edges_count - edges_to_leave_count
-
-    random_edges_mask = np.concatenate((utils.repeat_bool(True, edges_to_leave_count),
-            utils.repeat_bool(False, edges_to_delete_count)))
 
-    np.random.shuffle(random_edges_mask)
+    random_edges_mask = utils.repeat_bool(False, triangulated_tree.edges_count)
+    random_edges_mask[np.random.choice(triangulated_tree.edges_count, edges_to_leave_count,
+            replace=False)] = True
 
     _, _, graph = planar_graph_constructor.construct_subgraph(triangulated_tree,
             utils.repeat_bool(True, triangulated_tree.size), random_edges_mask)
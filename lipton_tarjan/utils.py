@@ -1,28 +1,24 @@
 import numpy as np
-from .queue import Queue
 from .separation_class import SeparationClass
 
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    connected_components = None
 
-def repeat_int(value, count):
 
-    array = np.zeros(count, dtype=np.int32)
-    array[:] = value
+def repeat_int(value, count):
 
-    return array
+    return np.full(count, value, dtype=np.int32)
 
 def repeat_bool(value, count):
 
-    array = np.zeros(count, dtype=np.bool_)
-    array[:] = value
-
-    return array
-
-def repeat_float(value, count): 
+    return np.full(count, value, dtype=np.bool_)
 
-    array = np.zeros(count, dtype=np.float32)
-    array[:] = value
+def repeat_float(value, count):
 
-    return array
+    return np.full(count, value, dtype=np.float32)
 
 def make_traverse_graph_via_bfs(callback):
     """
@@ -31,16 +27,25 @@ def make_traverse_graph_via_bfs(callback):
 
     def traverse_graph_via_bfs(start_vertex, graph, used_vertex_flags, result):
 
-        queue = Queue()
-        queue.append(start_vertex)
+        incidence_offsets = graph.incidence_offsets
+        incidence_edge_indices = graph.incidence_edge_indices
+
+        # each vertex is enqueued at most once, so the queue never wraps around
+
+        queue = np.empty(graph.size, dtype=np.int32)
+        queue[0] = start_vertex
+        queue_head = 0
+        queue_tail = 1
 
         used_vertex_flags[start_vertex] = True
 
-        while not queue.is_empty():
+        while queue_head != queue_tail:
 
-            vertex = queue.popleft()
+            vertex = queue[queue_head]
+            queue_head += 1
 
-            for incident_edge_index in graph.get_incident_edge_indices(vertex):
+            for incident_edge_index in \
+                    incidence_edge_indices[incidence_offsets[vertex]:incidence_offsets[vertex + 1]]:
 
                 adjacent_vertex = graph.edges.get_opposite_vertex(incident_edge_index, vertex)
 
@@ -48,77 +53,131 @@ def make_traverse_graph_via_bfs(callback):
 
                     callback(vertex, graph.edges, incident_edge_index, result)
                     used_vertex_flags[adjacent_vertex] = True
-                    queue.append(adjacent_vertex)
+                    queue[queue_tail] = adjacent_vertex
+                    queue_tail += 1
 
     return traverse_graph_via_bfs
 
-def _color_adjacent_vertex(vertex, edges, incident_edge_index, colors):
+def color_connected_components(graph):
 
-    adjacent_vertex = edges.get_opposite_vertex(incident_edge_index, vertex)
-    colors[adjacent_vertex] = colors[vertex]
+    if connected_components is None:
+        return _color_connected_components_via_bfs(graph)
 
-_mark_connected_component = make_traverse_graph_via_bfs(_color_adjacent_vertex)
+    adjacency_matrix = coo_matrix((np.ones(graph.edges_count, dtype=np.int32),
+            (graph.edges.vertex1, graph.edges.vertex2)), shape=(graph.size, graph.size)).tocsr()
 
-def color_connected_components(graph):
+    _, colors = connected_components(adjacency_matrix, directed=False)
+
+    return colors.astype(np.int32)
+
+def _color_connected_components_via_bfs(graph):
+
+    incidence_offsets = graph.incidence_offsets
+    incidence_edge_indices = graph.incidence_edge_indices
 
     colors = repeat_int(-1, graph.size)
     current_color = -1
 
-    used_vertex_flags = repeat_bool(False, graph.size)
+    # components are traversed one after another through the same queue, each vertex is
+    # enqueued once
 
-    for vertex in range(graph.size):
-        if not used_vertex_flags[vertex]:
+    queue = np.empty(graph.size, dtype=np.int32)
+    queue_head = 0
+    queue_tail = 0
+
+    for start_vertex in range(graph.size):
+        if colors[start_vertex] == -1:
 
             current_color += 1
-            colors[vertex] = current_color
-            _mark_connected_component(vertex, graph, used_vertex_flags, colors)
+            colors[start_vertex] = current_color
+
+            queue[queue_tail] = start_vertex
+            queue_tail += 1
+
+            while queue_head != queue_tail:
+
+                vertex = queue[queue_head]
+                queue_head += 1
+
+                for incident_edge_index in incidence_edge_indices[
+                        incidence_offsets[vertex]:incidence_offsets[vertex + 1]]:
+
+                    adjacent_vertex = graph.edges.get_opposite_vertex(incident_edge_index, vertex)
+
+                    if colors[adjacent_vertex] == -1:
+
+                        colors[adjacent_vertex] = current_color
+                        queue[queue_tail] = adjacent_vertex
+                        queue_tail += 1
 
     return colors
 
-def make_traverse_graph_via_post_order_dfs(callback):
+def traverse_graph_via_post_order_dfs(start_vertex, graph, edges_mask):
+    """
+        Returns vertices reachable from `start_vertex` via `edges_mask` edges in DFS post-order
+        and DFS tree parent edge indices (-1 for `start_vertex` and unreachable vertices).
+    """
+
+    parent_edge_indices = repeat_int(-1, graph.size)
 
-    def traverse_graph_via_post_order_dfs(start_vertex, graph, edges_mask, result):
+    used_vertex_flags = repeat_bool(False, graph.size)
+    used_vertex_flags[start_vertex] = True
 
-        parent_edge_indices = repeat_int(-1, graph.size)
+    incidence_offsets = graph.incidence_offsets
+    incidence_edge_indices = graph.incidence_edge_indices
 
-        used_vertex_flags = repeat_bool(False, graph.size)
-        used_vertex_flags[start_vertex] = True
+    # each vertex is pushed at most once, along with the position in `incidence_edge_indices`
+    # to continue scanning its incident edges from
 
-        stack = [start_vertex]
+    stack_vertices = np.empty(graph.size, dtype=np.int32)
+    stack_incidence_indices = np.empty(graph.size, dtype=np.int32)
 
-        while len(stack) != 0:
+    stack_vertices[0] = start_vertex
+    stack_incidence_indices[0] = incidence_offsets[start_vertex]
+    stack_size = 1
 
-            vertex = stack.pop()
-            stack.append(vertex)
+    post_order_vertices = np.empty(graph.size, dtype=np.int32)
+    post_order_vertices_count = 0
 
-            new_vertices_added_to_stack = False
+    while stack_size != 0:
 
-            for incident_edge_index in graph.get_incident_edge_indices(vertex):
-                if edges_mask[incident_edge_index]:
+        vertex = stack_vertices[stack_size - 1]
+        incidence_index = stack_incidence_indices[stack_size - 1]
+        incidence_end_index = incidence_offsets[vertex + 1]
 
-                    adjacent_vertex = graph.edges.get_opposite_vertex(incident_edge_index, vertex)
+        child_vertex = -1
+
+        while incidence_index != incidence_end_index and child_vertex == -1:
 
-                    if not used_vertex_flags[adjacent_vertex]:
+            incident_edge_index = incidence_edge_indices[incidence_index]
+            incidence_index += 1
 
-                        parent_edge_indices[adjacent_vertex] = incident_edge_index
+            if edges_mask[incident_edge_index]:
+
+                adjacent_vertex = graph.edges.get_opposite_vertex(incident_edge_index, vertex)
+
+                if not used_vertex_flags[adjacent_vertex]:
+                    child_vertex = adjacent_vertex
+                    parent_edge_indices[child_vertex] = incident_edge_index
 
-                        used_vertex_flags[adjacent_vertex] = True
-                        stack.append(adjacent_vertex)
+        stack_incidence_indices[stack_size - 1] = incidence_index
 
-                        new_vertices_added_to_stack = True
+        if child_vertex != -1:
 
-            if not new_vertices_added_to_stack:
+            used_vertex_flags[child_vertex] = True
 
-                stack.pop()
+            stack_vertices[stack_size] = child_vertex
+            stack_incidence_indices[stack_size] = incidence_offsets[child_vertex]
+            stack_size += 1
 
-                parent_edge_index = parent_edge_indices[vertex]
+        else:
 
-                if parent_edge_index != -1:
-                    callback(vertex, graph.edges, parent_edge_index, result)
+            stack_size -= 1
 
-        return parent_edge_indices
+            post_order_vertices[post_order_vertices_count] = vertex
+            post_order_vertices_count += 1
 
-    return traverse_graph_via_post_order_dfs
+    return post_order_vertices[:post_order_vertices_count], parent_edge_indices
 
 def iterate_subgraph_incidence_indices(graph, subgraph_edges_mask, possible_incidences_mask,
         start_vertex_in_subgraph, start_edge_index_in_subgraph):